@@ -0,0 +1,27 @@
+"""Build-time compressor for the editor guideline documents.
+
+The guideline markdown is highly repetitive prose that gzips down several
+times over. This writes prompts/<role>.md.gz next to each source file;
+get_prompt prefers the compressed form when present and pays a one-time,
+cached decompress instead of keeping the full text on disk per deployment.
+The .gz files are derived artifacts (gitignored) -- regenerate them at
+build/install time with:
+
+    python _compress_prompts.py
+"""
+import gzip
+from pathlib import Path
+
+
+def main() -> None:
+    prompt_dir = Path(__file__).with_name("prompts")
+    for source in sorted(prompt_dir.glob("*.md")):
+        target = source.with_name(source.name + ".gz")
+        data = source.read_bytes()
+        # mtime=0 keeps the output reproducible across builds
+        target.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        print(f"{target.name}: {len(data)} -> {target.stat().st_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
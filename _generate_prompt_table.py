@@ -0,0 +1,36 @@
+"""Build-time generator for _prompt_table.py.
+
+Enumerates every build_editor_system_prompt input combination (32 editor
+subsets x improvement flag x sequential flag) and bakes the finished prompts
+into a module-level table. At runtime a request becomes a single dict lookup
+and importing the table is one .pyc unmarshal, so even cold calls skip the
+string-assembly work entirely. The generated file is large and derived, so it
+is gitignored; regenerate it at build/install time with:
+
+    python _generate_prompt_table.py
+"""
+from pathlib import Path
+
+import edit_content_prompt as ecp
+
+
+def main() -> None:
+    entries = []
+    for mask in range(32):
+        for is_improvement in (False, True):
+            for sequential in (False, True):
+                key = (mask << 2) | (is_improvement << 1) | sequential
+                prompt = ecp._build(mask, is_improvement, sequential)
+                entries.append(f"    {key}: {prompt!r},")
+
+    out = Path(__file__).with_name("_prompt_table.py")
+    out.write_text(
+        '"""Generated by _generate_prompt_table.py -- do not edit by hand."""\n\n'
+        "TABLE: dict[int, str] = {\n" + "\n".join(entries) + "\n}\n",
+        encoding="utf-8",
+    )
+    print(f"wrote {out.name}: {len(entries)} entries, {out.stat().st_size} bytes")
+
+
+if __name__ == "__main__":
+    main()